@@ -31,6 +31,10 @@ from enginepy.telli.models import TelliWebhook
 
 logger = logging.getLogger(__name__)
 
+# Shared, immutable timeouts reused by every request
+DEFAULT_TIMEOUT = httpx.Timeout(30.0)
+HEALTH_TIMEOUT = httpx.Timeout(10.0)
+TRANSFER_TIMEOUT = httpx.Timeout(300.0)  # Increased timeout for document downloads/uploads
 
 API_ENDPOINT_METADATA: dict[str, dict[str, Any]] = {
     "update_doc": {
@@ -244,7 +248,7 @@ class EngineClient(BaseClient):
             params={},
             json=data,
             headers=request_headers,
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -279,7 +283,7 @@ class EngineClient(BaseClient):
             params={},
             json=data_dict,
             headers=request_headers,
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -305,7 +309,7 @@ class EngineClient(BaseClient):
         resp = await self.session.get(
             self._url(path),
             headers=request_headers,
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -327,7 +331,7 @@ class EngineClient(BaseClient):
         path = f"/api/admin/documents/{document_id}"
         token = self._get_token(API_ENDPOINT_METADATA["get_document_url"]["tokens"])
         headers = self.headers(token=token, extra={"Accept": "application/json"})
-        resp = await self.session.get(self._url(path), headers=headers, timeout=httpx.Timeout(30.0))
+        resp = await self.session.get(self._url(path), headers=headers, timeout=DEFAULT_TIMEOUT)
         await self.log_request(resp)
         resp.raise_for_status()
         return DocumentUrlResponse.model_validate(resp.json())
@@ -362,7 +366,7 @@ class EngineClient(BaseClient):
         resp = await self.session.get(
             self._url(path),
             headers=headers,
-            timeout=httpx.Timeout(300.0),  # Increased timeout for downloads
+            timeout=TRANSFER_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -432,7 +436,7 @@ class EngineClient(BaseClient):
             self._url(path),
             data=payload,
             headers=request_headers,
-            timeout=httpx.Timeout(300.0),
+            timeout=TRANSFER_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -467,7 +471,7 @@ class EngineClient(BaseClient):
             self._url(path),
             params=params,
             headers=request_headers,
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -507,7 +511,7 @@ class EngineClient(BaseClient):
         resp = await self.session.get(
             self._url(path),
             headers=request_headers,
-            timeout=httpx.Timeout(10.0),
+            timeout=HEALTH_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -537,7 +541,7 @@ class EngineClient(BaseClient):
             self._url(path),
             params=params,
             headers=request_headers,
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -603,7 +607,7 @@ class EngineClient(BaseClient):
             self._url(path),
             headers=request_headers,
             data=payload,
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -648,7 +652,7 @@ class EngineClient(BaseClient):
             headers=request_headers,
             data=payload,
             params={},
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -679,7 +683,7 @@ class EngineClient(BaseClient):
             params={},
             json=data_dict,
             headers=request_headers,
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -708,7 +712,7 @@ class EngineClient(BaseClient):
             url,
             json=data_dict,
             headers=request_headers,
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
@@ -737,7 +741,7 @@ class EngineClient(BaseClient):
             url,
             json=data,
             headers=request_headers,
-            timeout=httpx.Timeout(30.0),
+            timeout=DEFAULT_TIMEOUT,
         )
         await self.log_request(resp)
         resp.raise_for_status()
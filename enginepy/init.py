@@ -4,6 +4,9 @@ import logfire
 
 from enginepy.config import ConfigSchema, LogfireConfigSchema
 
+# URL patterns kept out of the FastAPI traces
+_EXCLUDED_URLS: tuple[str, ...] = (".*/docs", ".*/redoc", ".*/metrics", ".*/health")
+
 
 def init_logfire(
     config: LogfireConfigSchema, mode: Literal["server", "worker"] = "server", extra: dict[str, Any] | None = None
@@ -15,13 +18,9 @@ def init_logfire(
         logfire.instrument_openai_agents()
         if mode == "server" and extra is not None and extra.get("app"):
             app = extra["app"]
-            logfire.instrument_fastapi(
-                app, capture_headers=True, excluded_urls=[".*/docs", ".*/redoc", ".*/metrics", ".*/health"]
-            )
+            logfire.instrument_fastapi(app, capture_headers=True, excluded_urls=_EXCLUDED_URLS)
 
 
 def init(config: ConfigSchema, mode: Literal["server", "worker"] = "server", extra: dict[str, Any] | None = None):
-    if not extra:
-        extra = {}
-    extra["env"] = config.app.get("env", "dev")
-    init_logfire(config.logfire, mode, extra)
+    merged = (extra or {}) | {"env": config.app.get("env", "dev")}
+    init_logfire(config.logfire, mode, merged)
@@ -243,7 +243,6 @@ def test_cli_command_missing_required_arg_option(runner: CliRunner, mock_engine_
 # These tests do NOT use the patch_dependencies fixture's patch on _execute_api_call
 # These tests focus on the logic within _execute_api_call itself.
 
-@pytest.mark.asyncio
 async def test_execute_api_call_success(mock_engine_client: MagicMock, capsys):
     """Test successful execution within _execute_api_call."""
     method_name = "get_case_data"
@@ -261,7 +260,6 @@ async def test_execute_api_call_success(mock_engine_client: MagicMock, capsys):
     assert json.dumps(expected_result, indent=2) in captured.out
 
 
-@pytest.mark.asyncio
 async def test_execute_api_call_pydantic_arg_success(mock_engine_client: MagicMock, capsys):
     """Test _execute_api_call with a Pydantic model argument."""
     method_name = "create_request"
@@ -282,7 +280,6 @@ async def test_execute_api_call_pydantic_arg_success(mock_engine_client: MagicMo
     assert json.dumps(expected_result, indent=2) in captured.out
 
 
-@pytest.mark.asyncio
 async def test_execute_api_call_list_arg_success(mock_engine_client: MagicMock, capsys):
     """Test _execute_api_call with a list argument."""
     method_name = "update_doc"
@@ -304,7 +301,6 @@ async def test_execute_api_call_list_arg_success(mock_engine_client: MagicMock,
     assert output_data == {"success": True}
 
 
-@pytest.mark.asyncio
 async def test_execute_api_call_api_error(mock_engine_client: MagicMock, capsys):
     """Test _execute_api_call handling ClientResponseError."""
     method_name = "get_case_data"
@@ -332,7 +328,6 @@ async def test_execute_api_call_api_error(mock_engine_client: MagicMock, capsys)
     mock_engine_client.get_case_data.assert_awaited_once_with(request_id=404)
 
 
-@pytest.mark.asyncio
 async def test_execute_api_call_validation_error(mock_engine_client: MagicMock, capsys):
     """Test _execute_api_call handling argument validation errors."""
     method_name = "get_case_data"
@@ -350,7 +345,6 @@ async def test_execute_api_call_validation_error(mock_engine_client: MagicMock,
     mock_engine_client.get_case_data.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_execute_api_call_missing_required_arg(mock_engine_client: MagicMock, capsys):
     """Test _execute_api_call handling missing required arguments."""
     method_name = "get_case_data"
@@ -368,7 +362,6 @@ async def test_execute_api_call_missing_required_arg(mock_engine_client: MagicMo
     mock_engine_client.get_case_data.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_execute_api_call_unexpected_error(mock_engine_client: MagicMock, capsys):
     """Test _execute_api_call handling unexpected errors during API call."""
     method_name = "health"
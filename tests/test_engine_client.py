@@ -1,17 +1,19 @@
 import json
-import os
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, call
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import parse_qs
 
 import httpx
 import pytest
 import pytest_asyncio
 import respx
+from pydantic import BaseModel
 
 from enginepy import __version__
 from enginepy.config import EngineConfigSchema, EngineTokensConfigSchema
-from enginepy.engine_client import EngineClient
+from enginepy.engine_client import DEFAULT_TIMEOUT, HEALTH_TIMEOUT, TRANSFER_TIMEOUT, EngineClient
 from enginepy.models import (
     AgentClassifierWorkflowOutput,
     AwsClassifierResult,
@@ -32,68 +34,247 @@ from enginepy.models import (
     RequestDocumentsResponse,
     WithContentMode,
 )
-from enginepy.telli.models import TelliWebhook
 
+# Keep the module on a single xdist worker (`pytest -n auto --dist=loadgroup`) so the
+# shared client and models are built once per run; tests run on the session event loop
+# the client is created on
+pytestmark = [pytest.mark.xdist_group("engine_client"), pytest.mark.asyncio(loop_scope="session")]
+
+TEST_ENDPOINT = "http://test-engine.local"
+TEST_TOKEN = "test-token-123"
+DOC_ID = 123
+REQUEST_ID = 456
+TRIGGER_ID = "trigger-abc"
+FIXED_DT = datetime(2024, 1, 1, 12, 0, 0)
+# Correct User-Agent format based on BaseClient behavior
+EXPECTED_USER_AGENT = f"ant31box-cli/engine-{__version__}"
+
+# Headers sent by default, and by get_document_url which asks for JSON explicitly
+EXPECTED_HEADERS = {"accept": "*/*", "token": TEST_TOKEN, "user-agent": EXPECTED_USER_AGENT}
+EXPECTED_JSON_HEADERS = EXPECTED_HEADERS | {"accept": "application/json"}
+
+# Fully-built URLs (query string included) for the endpoints taking params
+CASE_DATA_URL = str(
+    httpx.URL(
+        f"{TEST_ENDPOINT}/api/case_data",
+        params={"request_id": REQUEST_ID, "with_summary": "false", "with_wwm": "true"},
+    )
+)
+REQUEST_DOCS_URL = f"{TEST_ENDPOINT}/api/admin/requests/{REQUEST_ID}/documents.json"
+DOCUMENT_URL = f"{TEST_ENDPOINT}/api/admin/documents/{DOC_ID}"
+PDF_CONTENT = b"This is a test PDF content."
+ACTION_TRIGGER_ENDPOINT = f"{TEST_ENDPOINT}/api/admin/action_triggers/{TRIGGER_ID}"
+ACTION_TRIGGER_URL = str(
+    httpx.URL(ACTION_TRIGGER_ENDPOINT, params={"request_id": REQUEST_ID, "client": "test_client", "attempt": 2})
+)
 
-@pytest.fixture
-def test_endpoint() -> str:
-    """Fixture for the test API endpoint."""
-    return "http://test-engine.local"
+# Serialized `fields` form values expected for engine_request / updated_engine_request
+FIELDS_JSON_CREATE = json.dumps(
+    [{"field": "field1", "answer": "value1", "type": "string"}], sort_keys=True, default=str
+)
+FIELDS_JSON_UPDATE = json.dumps(
+    [{"field": "field1", "answer": "value1_updated", "type": "string"}], sort_keys=True, default=str
+)
+
+# Response of /api/admin/requests/{id}/documents.json, pre-serialized for the mocked route
+REQUEST_DOCS_PAYLOAD: dict = {
+    "request": {
+        "id": REQUEST_ID,
+        "files": [
+            {
+                "id": 2469711,
+                "physical_mails": [],
+                "type": "IN_Erfolgs_Vereinbarung bei Mietsenkung_en",
+                "image": False,
+                "pdf": True,
+                "filename": "Erfolgs-Vereinbarung bei Mietsenkung_English.pdf",
+                "incoming": False,
+                "uncategorized": False,
+                "edit_url": f"/admin/requests/{REQUEST_ID}/zieb?document_id=2469711",
+                "approved": True,
+                "attachment": False,
+                "created_at": "2025-11-26T15:01:36.778Z",
+                "court_processing_kind": None,
+                "type_title": "IN_Erfolgs_Vereinbarung bei Mietsenkung_en",
+                "approved_at": "Mittwoch, 26. November 2025, 16:01 Uhr",
+                "uploaded_by": "00 Mietright Zentrale",
+                "approved_by": "00 Mietright Zentrale",
+                "created_at_text": "etwa 20 Stunden",
+                "approved_at_text": "Mittwoch, 26. November 2025, 16:01 Uhr",
+                "sensitive": False,
+                "eb_date": None,
+                "court_id": None,
+                "court_type": False,
+                "file_extension": "pdf",
+                "court_attachment": False,
+                "original_size": 78920,
+                "size": "77,1 KB",
+            }
+        ],
+    },
+    "presigned_post": {
+        "s3-data": {
+            "key": f"requests/{REQUEST_ID}/files/some-uuid/${{filename}}",
+            "success_action_status": "201",
+            "acl": "private",
+            "policy": "some-policy",
+            "x-amz-credential": "some-credential",
+            "x-amz-algorithm": "AWS4-HMAC-SHA256",
+            "x-amz-date": "20251127T112143Z",
+            "x-amz-signature": "some-signature",
+        },
+        "s3-url": "https://some.s3.url.com",
+        "s3-host": "some.s3.host.com",
+    },
+}
+REQUEST_DOCS_BODY = json.dumps(REQUEST_DOCS_PAYLOAD).encode()
+DOCUMENT_URL_BODY = json.dumps({"url": "https://s3.example.com/some/file.pdf?sig=123"}).encode()
+
+# Values returned by the mocked action_trigger in test_action_triggers_success
+ACTION_TRIGGERS_RESULTS = [
+    EngineTrigger.model_construct(
+        request_id=REQUEST_ID, name="trigger1", trigger_id="tid1", attempt=1, status={"result": "ok1"}
+    ),
+    EngineTrigger.model_construct(
+        request_id=REQUEST_ID, name="trigger2", trigger_id="tid2", attempt=3, status={"result": "ok2"}
+    ),
+    EngineTrigger.model_construct(
+        request_id=REQUEST_ID, name="trigger3", trigger_id="tid3", attempt=4, status={"result": "ok3"}
+    ),
+]
+
+
+class _StubTelli:
+    """Minimal stand-in for TelliWebhook: scheduled_call_response only calls `model_dump_json`."""
+
+    def __init__(self, js: str) -> None:
+        self.model_dump_json = MagicMock(return_value=js)
+
+
+def _assert_request(request: httpx.Request, headers: dict[str, str], timeout: httpx.Timeout = DEFAULT_TIMEOUT) -> None:
+    """Checks the `headers` subset and the timeout sent with `request`."""
+    assert {key: request.headers.get(key) for key in headers} == headers
+    assert request.extensions["timeout"] == timeout.as_dict()
+
+
+@pytest.fixture(scope="module")
+def engine_request() -> EngineRequest:
+    """Fixture for an EngineRequest used to create a request."""
+    return EngineRequest(
+        product="prod_a",
+        funnel="funnel_b",
+        fields=[EngineField(field="field1", answer="value1", type=EngineTypeEnum.STRING)],
+    )
 
 
-@pytest.fixture
-def test_token() -> str:
-    """Fixture for the test API token."""
-    return "test-token-123"
+@pytest.fixture(scope="module")
+def updated_engine_request() -> EngineRequest:
+    """Fixture for an EngineRequest used to update a request."""
+    return EngineRequest(
+        product="prod_a_updated",
+        funnel="funnel_b_updated",
+        fields=[EngineField(field="field1", answer="value1_updated", type=EngineTypeEnum.STRING)],
+    )
 
 
-@pytest.fixture
-def doc_id() -> int:
-    """Fixture for a test document ID."""
-    return 123
+@pytest.fixture(scope="module")
+def docs_response() -> DocsResponse:
+    """Fixture for a DocsResponse sent as insights."""
+    return DocsResponse(
+        query=DocsQuery(
+            limit=100, mode=WithContentMode.SUMMARY, vectordb=ManagerEnum.NONE, output=OutputFormatEnum.JSON
+        ),
+        docs=[Content(metadata={"doc_id": "doc1"}, full="content1")],
+    )
 
 
-@pytest.fixture
-def request_id() -> int:
-    """Fixture for a test request ID."""
-    return 456
+@pytest.fixture(scope="module")
+def docs_dump(docs_response: DocsResponse) -> dict:
+    """Fixture for the payload expected when sending `docs_response`."""
+    return docs_response.model_dump(mode="json", exclude_none=True, exclude_unset=True)
 
 
-@pytest.fixture
-def trigger_id() -> str:
-    """Fixture for a test trigger ID."""
-    return "trigger-abc"
+@pytest.fixture(scope="module")
+def aws_result() -> AwsClassifierResult:
+    """Fixture for an AWS classifier result."""
+    return AwsClassifierResult(
+        job=AwsJobDescribe(id="job-123", name="test-job", submit_time=FIXED_DT, end_time=FIXED_DT),
+        inference=[AwsInference(line="doc1", classes=[])],
+        model="aws-model-v1",
+    )
+
+
+@pytest.fixture(scope="module")
+def aws_dump(aws_result: AwsClassifierResult) -> dict:
+    """Fixture for the payload expected when sending `aws_result`."""
+    return aws_result.model_dump(mode="json", exclude_none=True, exclude_unset=True)
+
+
+@pytest.fixture(scope="module")
+def agent_result() -> AgentClassifierWorkflowOutput:
+    """Fixture for an agent classifier workflow output."""
+    return AgentClassifierWorkflowOutput(
+        result=ClassificationRentalResponse(
+            classification=ClassificationRentalScore(category="cat1", reasoning="reason1", confidence_score=0.9)
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def agent_dump(agent_result: AgentClassifierWorkflowOutput) -> dict:
+    """Fixture for the payload expected when sending `agent_result`."""
+    return agent_result.model_dump(mode="json", exclude_none=True, exclude_unset=True)
+
+
+@pytest.fixture(scope="module")
+def _respx_router() -> Iterator[respx.MockRouter]:
+    """Patches httpx with a single respx router for the tests of this module."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router
 
 
 @pytest.fixture
-def expected_user_agent() -> str:
-    """Fixture for the expected User-Agent header."""
-    # Correct User-Agent format based on BaseClient behavior
-    return f"ant31box-cli/engine-{__version__}"
+def api_mock(_respx_router: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """
+    Fixture mocking the engine API transport; tests register their routes on it.
 
+    Routes and recorded calls are cleared after each test, once all registered routes
+    have been checked as called.
+    """
+    yield _respx_router
+    try:
+        _respx_router.assert_all_called()
+    finally:
+        _respx_router.clear()
+        _respx_router.reset()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncIterator[EngineClient]:
+    """
+    Fixture sharing one EngineClient across the test session.
 
-@pytest_asyncio.fixture
-async def client(test_endpoint: str, test_token: str) -> AsyncIterator[EngineClient]:
-    """Fixture to create an EngineClient instance for testing."""
-    instance = EngineClient(endpoint=test_endpoint, token=test_token)
+    The session is closed once at session teardown; tests must not mutate the client
+    (use `monkeypatch` or a dedicated instance instead).
+    """
+    instance = EngineClient(endpoint=TEST_ENDPOINT, token=TEST_TOKEN)
     yield instance
     await instance.session.aclose()
 
 
-@pytest.mark.asyncio
-async def test_set_token(client: EngineClient, test_token: str):
+async def test_set_token():
     """Test that set_token updates the client instance's token with instance-wide override."""
-    assert client.token == test_token
+    client = EngineClient(endpoint=TEST_ENDPOINT, token=TEST_TOKEN)
+    assert client.token == TEST_TOKEN
     new_token = "a-different-token"
     client.set_token(new_token)
     assert client.token == new_token
     assert client._override_token == new_token
 
+    await client.session.aclose()
+
 
-@pytest.mark.asyncio
-async def test_set_token_overrides_specific_token_when_no_key_given(
-    test_endpoint: str, trigger_id: str, request_id: int
-):
+async def test_set_token_overrides_specific_token_when_no_key_given(api_mock: respx.MockRouter):
     """
     Tests that set_token() without a key parameter overrides all tokens for this client instance,
     including specific tokens like admin.
@@ -102,7 +283,7 @@ async def test_set_token_overrides_specific_token_when_no_key_given(
     new_token = "new-global-override-token"
 
     cfg = EngineConfigSchema(
-        endpoint=test_endpoint,
+        endpoint=TEST_ENDPOINT,
         token="default-fallback-token",
         tokens=EngineTokensConfigSchema(admin=admin_token),
     )
@@ -110,22 +291,22 @@ async def test_set_token_overrides_specific_token_when_no_key_given(
     client = EngineClient(config=cfg)
     client.set_token(new_token)
 
-    trigger = EngineTrigger(trigger_id=trigger_id, request_id=request_id)
+    trigger = EngineTrigger(trigger_id=TRIGGER_ID, request_id=REQUEST_ID)
 
-    with respx.mock() as mock:
-        mock.put(url__regex=rf".*{trigger_id}.*").mock(return_value=httpx.Response(200, json={"status": "ok"}))
-        await client.action_trigger(trigger)
+    route = api_mock.put(url__regex=rf".*{TRIGGER_ID}.*").mock(
+        return_value=httpx.Response(200, json={"status": "ok"})
+    )
+    await client.action_trigger(trigger)
 
-        assert len(mock.calls) > 0
-        req = mock.calls.last.request
-        assert req.headers["token"] == new_token
-        assert req.headers["token"] != admin_token
+    assert route.call_count == 1
+    req = route.calls.last.request
+    assert req.headers["token"] == new_token
+    assert req.headers["token"] != admin_token
 
     await client.session.aclose()
 
 
-@pytest.mark.asyncio
-async def test_set_token_with_key_updates_specific_token(test_endpoint: str, trigger_id: str, request_id: int):
+async def test_set_token_with_key_updates_specific_token(api_mock: respx.MockRouter):
     """
     Tests that set_token(token, key) updates a specific token in config.tokens.
     """
@@ -133,7 +314,7 @@ async def test_set_token_with_key_updates_specific_token(test_endpoint: str, tri
     new_admin_token = "new-admin-token"
 
     cfg = EngineConfigSchema(
-        endpoint=test_endpoint,
+        endpoint=TEST_ENDPOINT,
         token="default-fallback-token",
         tokens=EngineTokensConfigSchema(admin=original_admin_token),
     )
@@ -141,295 +322,220 @@ async def test_set_token_with_key_updates_specific_token(test_endpoint: str, tri
     client = EngineClient(config=cfg)
     client.set_token(new_admin_token, key="admin")
 
-    trigger = EngineTrigger(trigger_id=trigger_id, request_id=request_id)
+    trigger = EngineTrigger(trigger_id=TRIGGER_ID, request_id=REQUEST_ID)
 
-    with respx.mock() as mock:
-        mock.put(url__regex=rf".*{trigger_id}.*").mock(return_value=httpx.Response(200, json={"status": "ok"}))
-        await client.action_trigger(trigger)
+    route = api_mock.put(url__regex=rf".*{TRIGGER_ID}.*").mock(
+        return_value=httpx.Response(200, json={"status": "ok"})
+    )
+    await client.action_trigger(trigger)
 
-        assert len(mock.calls) > 0
-        req = mock.calls.last.request
-        assert req.headers["token"] == new_admin_token
+    assert route.call_count == 1
+    req = route.calls.last.request
+    assert req.headers["token"] == new_admin_token
 
     await client.session.aclose()
 
 
-@pytest.mark.asyncio
-async def test_headers_with_extra(client: EngineClient, test_token: str, expected_user_agent: str):
+async def test_headers_with_extra(client: EngineClient):
     """Test that the headers method includes extra headers."""
     extra_headers = {"X-Custom-Header": "CustomValue"}
     headers = client.headers(extra=extra_headers)
 
     assert headers["X-Custom-Header"] == "CustomValue"
-    assert headers["token"] == test_token
-    assert headers["User-Agent"] == expected_user_agent
+    assert headers["token"] == TEST_TOKEN
+    assert headers["User-Agent"] == EXPECTED_USER_AGENT
     assert headers["Accept"] == "*/*"
 
 
-@pytest.mark.asyncio
-async def test_health_success(client: EngineClient, test_endpoint: str, test_token: str, expected_user_agent: str):
+async def test_health_success(client: EngineClient, api_mock: respx.MockRouter):
     """Test successful health check."""
-    with respx.mock() as mock:
-        mock.get(f"{test_endpoint}/_health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
-        response = await client.health()
-        assert response is True
-        assert len(mock.calls) > 0
-        req = mock.calls.last.request
-        assert req.headers["token"] == test_token
-        assert req.headers["accept"] == "*/*"
-
-
-@pytest.mark.asyncio
-async def test_health_failure(client: EngineClient, test_endpoint: str):
-    """Test failed health check."""
-    with respx.mock() as mock:
-        mock.get(f"{test_endpoint}/_health").mock(return_value=httpx.Response(500, json={"error": "internal server error"}))
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await client.health()
-        assert exc_info.value.response.status_code == 500
-
-
-@pytest.mark.asyncio
-async def test_get_case_data_success(
-    client: EngineClient, test_endpoint: str, test_token: str, request_id: int, expected_user_agent: str
-):
-    """Tests successful retrieval of case data."""
-    expected_path = "/api/case_data"
-    expected_response_payload = {"user": {"email": "toto"}}
-
-    with respx.mock() as mock:
-        mock.get(url__regex=rf".*{expected_path}.*").mock(
-            return_value=httpx.Response(200, json=expected_response_payload)
-        )
-        response = await client.get_case_data(request_id, with_summary=False)
+    route = api_mock.get(f"{TEST_ENDPOINT}/_health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+    response = await client.health()
+    assert response is True
+    assert route.call_count == 1
+    req = route.calls.last.request
+    assert req.headers["token"] == TEST_TOKEN
+    assert req.headers["accept"] == "*/*"
+    assert req.extensions["timeout"] == HEALTH_TIMEOUT.as_dict()
 
-        assert response.model_dump(exclude_none=True, exclude_unset=True) == expected_response_payload
-        assert len(mock.calls) > 0
-        req = mock.calls.last.request
-        assert req.headers["token"] == test_token
-        assert "request_id" in str(req.url)
-        assert "with_summary=false" in str(req.url)
 
+async def test_get_case_data_success(client: EngineClient, api_mock: respx.MockRouter):
+    """Tests successful retrieval of case data."""
+    expected_response_payload = {"user": {"email": "toto"}}
 
-@pytest.mark.asyncio
-async def test_get_case_data_failure(
-    client: EngineClient, test_endpoint: str, test_token: str, request_id: int, expected_user_agent: str
-):
-    """Tests failure scenario for retrieving case data (e.g., 404 Not Found)."""
-    expected_path = "/api/case_data"
-
-    with respx.mock() as mock:
-        mock.get(url__regex=rf".*{expected_path}.*").mock(return_value=httpx.Response(404))
-
-        with pytest.raises(httpx.HTTPStatusError) as excinfo:
-            await client.get_case_data(request_id)
+    route = api_mock.get(CASE_DATA_URL).mock(return_value=httpx.Response(200, json=expected_response_payload))
+    response = await client.get_case_data(REQUEST_ID, with_summary=False)
 
-        assert excinfo.value.response.status_code == 404
-        assert len(mock.calls) > 0
+    assert response.model_dump(exclude_none=True, exclude_unset=True) == expected_response_payload
+    assert route.call_count == 1
+    req = route.calls.last.request
+    assert req.headers["token"] == TEST_TOKEN
+    assert str(req.url) == CASE_DATA_URL
 
 
-@pytest.mark.asyncio
-async def test_update_doc_success(client: EngineClient, test_endpoint: str, test_token: str, doc_id: int, expected_user_agent: str):
+async def test_update_doc_success(client: EngineClient, api_mock: respx.MockRouter):
     """Test successful document update."""
     ocr_pages = ["page 1 text", "page 2 text"]
     pdf_url = "http://example.com/doc.pdf"
     expected_payload = {
-        "document_id": str(doc_id),
+        "document_id": str(DOC_ID),
         "ocr": ocr_pages,
         "searchable_pdf_url": pdf_url,
     }
 
-    with respx.mock() as mock:
-        mock.post(f"{test_endpoint}/api/zieb/documents/ocr").mock(return_value=httpx.Response(200))
-        result = await client.update_doc(doc_id, ocr_pages, pdf_url)
-        assert result is True
-        assert len(mock.calls) > 0
-        req = mock.calls.last.request
-        assert req.headers["token"] == test_token
-        assert json.loads(req.content) == expected_payload
+    route = api_mock.post(f"{TEST_ENDPOINT}/api/zieb/documents/ocr").mock(return_value=httpx.Response(200))
+    result = await client.update_doc(DOC_ID, ocr_pages, pdf_url)
+    assert result is True
+    assert route.call_count == 1
+    req = route.calls.last.request
+    assert req.headers["token"] == TEST_TOKEN
+    assert json.loads(req.content) == expected_payload
 
 
-@pytest.mark.asyncio
-async def test_update_doc_failure(client: EngineClient, test_endpoint: str, doc_id: int):
+async def test_update_doc_failure(client: EngineClient, api_mock: respx.MockRouter):
     """Test failed document update."""
-    with respx.mock() as mock:
-        mock.post(f"{test_endpoint}/api/zieb/documents/ocr").mock(return_value=httpx.Response(400))
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await client.update_doc(doc_id, ["page text"])
-        assert exc_info.value.response.status_code == 400
+    api_mock.post(f"{TEST_ENDPOINT}/api/zieb/documents/ocr").mock(return_value=httpx.Response(400))
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.update_doc(DOC_ID, ["page text"])
+    assert exc_info.value.response.status_code == 400
 
 
 # Add more tests for other methods (update_doc_suggestions, action_trigger, etc.)
 # following a similar pattern:
 # 1. Define input data (models).
-# 2. Use `aioresponses` context manager.
-# 3. Mock the expected URL, method, status, and optionally payload.
+# 2. Request the `api_mock` fixture (respx router).
+# 3. Register a route for the expected URL and method, with the response status and optionally payload.
 # 4. Call the client method.
 # 5. Assert the response or raised exception.
-# 6. Use `m.assert_called_once_with(...)` to verify the request details (URL, method, headers, json/data, params).
+# 6. Check `route.call_count` and inspect `route.calls.last.request` (URL, headers, body, params).
 
 
-@pytest.mark.asyncio
-async def test_action_trigger_success(client: EngineClient, test_endpoint: str, test_token: str, trigger_id: str, request_id: int, expected_user_agent: str):
+async def test_action_trigger_success(client: EngineClient, api_mock: respx.MockRouter):
     """Test successful action trigger."""
     trigger = EngineTrigger(
-        trigger_id=trigger_id,
-        request_id=request_id,
+        trigger_id=TRIGGER_ID,
+        request_id=REQUEST_ID,
         name="test_trigger",
         client="test_client",
         attempt=2,
     )
     response_payload = {"status": "processed"}
 
-    with respx.mock() as mock:
-        mock.put(url__regex=rf".*{trigger_id}.*").mock(return_value=httpx.Response(200, json=response_payload))
-        updated_trigger = await client.action_trigger(trigger)
+    route = api_mock.put(ACTION_TRIGGER_URL).mock(return_value=httpx.Response(200, json=response_payload))
+    updated_trigger = await client.action_trigger(trigger)
 
-        assert updated_trigger is trigger
-        assert updated_trigger.status == response_payload
-        assert len(mock.calls) > 0
-        req = mock.calls.last.request
-        assert req.headers["token"] == test_token
-        assert "request_id" in str(req.url)
-        assert "client=test_client" in str(req.url)
+    assert updated_trigger is trigger
+    assert updated_trigger.status == response_payload
+    assert route.call_count == 1
+    req = route.calls.last.request
+    assert req.headers["token"] == TEST_TOKEN
+    assert str(req.url) == ACTION_TRIGGER_URL
 
 
-@pytest.mark.asyncio
-async def test_action_trigger_failure(client: EngineClient, test_endpoint: str, trigger_id: str, request_id: int):
+async def test_action_trigger_failure(client: EngineClient, api_mock: respx.MockRouter):
     """Test failed action trigger."""
-    trigger = EngineTrigger(trigger_id=trigger_id, request_id=request_id)
+    trigger = EngineTrigger(trigger_id=TRIGGER_ID, request_id=REQUEST_ID)
 
-    with respx.mock() as mock:
-        mock.put(url__regex=rf".*{trigger_id}.*").mock(return_value=httpx.Response(404))
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await client.action_trigger(trigger)
-        assert exc_info.value.response.status_code == 404
+    api_mock.put(ACTION_TRIGGER_ENDPOINT).mock(return_value=httpx.Response(404))
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.action_trigger(trigger)
+    assert exc_info.value.response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_create_request_success(client: EngineClient, test_endpoint: str, test_token: str, expected_user_agent: str):
+async def test_create_request_success(client: EngineClient, engine_request: EngineRequest, api_mock: respx.MockRouter):
     """Test successful request creation."""
-    req = EngineRequest(
-        product="prod_a",
-        funnel="funnel_b",
-        fields=[EngineField(field="field1", answer="value1", type=EngineTypeEnum.STRING)],
-    )
     response_payload = {"request_id": 789, "status": "created"}
-    expected_url = f"{test_endpoint}/api/admin/data_source"
+    expected_url = f"{TEST_ENDPOINT}/api/admin/data_source"
 
-    with respx.mock() as mock:
-        mock.post(expected_url).mock(return_value=httpx.Response(201, json=response_payload))
-        response = await client.create_request(req)
-        assert response == response_payload
-        assert len(mock.calls) > 0
-        req_sent = mock.calls.last.request
-        assert req_sent.headers["token"] == test_token
-        assert req_sent.headers["content-type"].startswith("application/x-www-form-urlencoded")
+    route = api_mock.post(expected_url).mock(return_value=httpx.Response(201, json=response_payload))
+    response = await client.create_request(engine_request)
+    assert response == response_payload
+    assert route.call_count == 1
+    req_sent = route.calls.last.request
+    assert req_sent.headers["token"] == TEST_TOKEN
+    assert req_sent.headers["content-type"].startswith("application/x-www-form-urlencoded")
+    assert parse_qs(req_sent.content.decode())["fields"] == [FIELDS_JSON_CREATE]
 
 
-@pytest.mark.asyncio
-async def test_update_request_success(client: EngineClient, test_endpoint: str, test_token: str, request_id: int, expected_user_agent: str):
+async def test_update_request_success(
+    client: EngineClient, updated_engine_request: EngineRequest, api_mock: respx.MockRouter
+):
     """Test successful request update."""
-    req = EngineRequest(
-        product="prod_a_updated",
-        funnel="funnel_b_updated",
-        fields=[EngineField(field="field1", answer="value1_updated", type=EngineTypeEnum.STRING)],
-    )
     response_payload = {"status": "updated"}
-    expected_url = f"{test_endpoint}/api/admin/data_source"
+    expected_url = f"{TEST_ENDPOINT}/api/admin/data_source"
 
-    with respx.mock() as mock:
-        mock.put(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
-        response = await client.update_request(request_id, req)
-        assert response == response_payload
-        assert len(mock.calls) > 0
-        req_sent = mock.calls.last.request
-        assert req_sent.headers["token"] == test_token
-        assert req_sent.headers["content-type"].startswith("application/x-www-form-urlencoded")
+    route = api_mock.put(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
+    response = await client.update_request(REQUEST_ID, updated_engine_request)
+    assert response == response_payload
+    assert route.call_count == 1
+    req_sent = route.calls.last.request
+    assert req_sent.headers["token"] == TEST_TOKEN
+    assert req_sent.headers["content-type"].startswith("application/x-www-form-urlencoded")
+    assert parse_qs(req_sent.content.decode())["fields"] == [FIELDS_JSON_UPDATE]
 
 
-@pytest.mark.asyncio
-async def test_update_insights_success(client: EngineClient, test_endpoint: str, test_token: str, expected_user_agent: str):
+async def test_update_insights_success(
+    client: EngineClient, docs_response: DocsResponse, docs_dump: dict, api_mock: respx.MockRouter
+):
     """Test successful insights update."""
-    docs_resp = DocsResponse(
-        query=DocsQuery(limit=100, mode=WithContentMode.SUMMARY, vectordb=ManagerEnum.NONE, output=OutputFormatEnum.JSON),
-        docs=[Content(metadata={"doc_id": "doc1"}, full="content1")],
-    )
     response_payload = {"message": "Insights updated"}
-    expected_url = f"{test_endpoint}/api/insights"
-
-    with respx.mock() as mock:
-        mock.post(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
-        response = await client.update_insights(docs_resp)
-        assert response == response_payload
-        assert len(mock.calls) > 0
-        req_sent = mock.calls.last.request
-        assert req_sent.headers["token"] == test_token
-        assert req_sent.headers["content-type"] == "application/json"
-        body = json.loads(req_sent.content)
-        assert "query" in body
-        assert "docs" in body
-
-
-@pytest.mark.asyncio
-async def test_update_doc_suggestions_aws_success(client: EngineClient, test_endpoint: str, test_token: str, expected_user_agent: str):
+    expected_url = f"{TEST_ENDPOINT}/api/insights"
+
+    route = api_mock.post(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
+    response = await client.update_insights(docs_response)
+    assert response == response_payload
+    assert route.call_count == 1
+    req_sent = route.calls.last.request
+    assert req_sent.headers["token"] == TEST_TOKEN
+    assert req_sent.headers["content-type"] == "application/json"
+    assert json.loads(req_sent.content) == docs_dump
+
+
+async def test_update_doc_suggestions_aws_success(
+    client: EngineClient, aws_result: AwsClassifierResult, aws_dump: dict, api_mock: respx.MockRouter
+):
     """Test successful document suggestions update using AwsClassifierResult."""
-    aws_result = AwsClassifierResult(
-        job=AwsJobDescribe(id="job-123", name="test-job", submit_time=datetime.now(), end_time=datetime.now()),
-        inference=[AwsInference(line="doc1", classes=[])],
-        model="aws-model-v1",
-    )
     response_payload = {"message": "Suggestions updated via AWS"}
-    expected_url = f"{test_endpoint}/api/zieb/documents/update_suggestions"
+    expected_url = f"{TEST_ENDPOINT}/api/zieb/documents/update_suggestions"
 
-    with respx.mock() as mock:
-        mock.post(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
-        response = await client.update_doc_suggestions(aws_result)
-        assert response == response_payload
-        assert len(mock.calls) > 0
-        req_sent = mock.calls.last.request
-        assert req_sent.headers["token"] == test_token
+    route = api_mock.post(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
+    response = await client.update_doc_suggestions(aws_result)
+    assert response == response_payload
+    assert route.call_count == 1
+    req_sent = route.calls.last.request
+    assert req_sent.headers["token"] == TEST_TOKEN
+    assert json.loads(req_sent.content) == aws_dump
 
 
-@pytest.mark.asyncio
-async def test_update_doc_suggestions_agent_success(client: EngineClient, test_endpoint: str, test_token: str, expected_user_agent: str):
+async def test_update_doc_suggestions_agent_success(
+    client: EngineClient, agent_result: AgentClassifierWorkflowOutput, agent_dump: dict, api_mock: respx.MockRouter
+):
     """Test successful document suggestions update using AgentClassifierWorkflowOutput."""
-    agent_result = AgentClassifierWorkflowOutput(
-        result=ClassificationRentalResponse(
-            classification=ClassificationRentalScore(category="cat1", reasoning="reason1", confidence_score=0.9)
-        )
-    )
     response_payload = {"message": "Suggestions updated via Agent"}
-    expected_url = f"{test_endpoint}/api/zieb/documents/update_suggestions"
+    expected_url = f"{TEST_ENDPOINT}/api/zieb/documents/update_suggestions"
 
-    with respx.mock() as mock:
-        mock.post(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
-        response = await client.update_doc_suggestions(agent_result)
-        assert response == response_payload
-        assert len(mock.calls) > 0
-        req_sent = mock.calls.last.request
-        assert req_sent.headers["token"] == test_token
+    route = api_mock.post(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
+    response = await client.update_doc_suggestions(agent_result)
+    assert response == response_payload
+    assert route.call_count == 1
+    req_sent = route.calls.last.request
+    assert req_sent.headers["token"] == TEST_TOKEN
+    assert json.loads(req_sent.content) == agent_dump
 
 
-@pytest.mark.asyncio
-async def test_update_doc_suggestions_failure(client: EngineClient, test_endpoint: str):
+async def test_update_doc_suggestions_failure(
+    client: EngineClient, agent_result: AgentClassifierWorkflowOutput, api_mock: respx.MockRouter
+):
     """Test failed document suggestions update."""
-    agent_result = AgentClassifierWorkflowOutput(
-        result=ClassificationRentalResponse(
-            classification=ClassificationRentalScore(category="cat1", reasoning="reason1", confidence_score=0.9)
-        )
-    )
-    expected_url = f"{test_endpoint}/api/zieb/documents/update_suggestions"
+    expected_url = f"{TEST_ENDPOINT}/api/zieb/documents/update_suggestions"
 
-    with respx.mock() as mock:
-        mock.post(expected_url).mock(return_value=httpx.Response(400, json={"error": "bad input"}))
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await client.update_doc_suggestions(agent_result)
-        assert exc_info.value.response.status_code == 400
+    api_mock.post(expected_url).mock(return_value=httpx.Response(400, json={"error": "bad input"}))
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.update_doc_suggestions(agent_result)
+    assert exc_info.value.response.status_code == 400
 
 
-@pytest.mark.asyncio
-async def test_action_triggers_success(client: EngineClient, request_id: int):
+async def test_action_triggers_success(client: EngineClient, monkeypatch: pytest.MonkeyPatch):
     """Test successful processing of multiple triggers via action_triggers."""
     triggers_input = [
         {"name": "trigger1", "trigger_id": "tid1"},
@@ -437,243 +543,191 @@ async def test_action_triggers_success(client: EngineClient, request_id: int):
         {"name": "trigger3", "trigger_id": "tid3", "attempt": 4}, # Test int attempt
     ]
 
-    # Expected EngineTrigger objects to be created and passed to action_trigger
-    expected_trigger1 = EngineTrigger(request_id=request_id, name="trigger1", trigger_id="tid1", attempt=1) # Default attempt
-    expected_trigger2 = EngineTrigger(request_id=request_id, name="trigger2", trigger_id="tid2", attempt=3)
-    expected_trigger3 = EngineTrigger(request_id=request_id, name="trigger3", trigger_id="tid3", attempt=4)
-
-    # Mock return values for action_trigger (can be the same objects or modified ones)
-    # Let's simulate action_trigger adding a status
-    mock_return1 = EngineTrigger(request_id=request_id, name="trigger1", trigger_id="tid1", attempt=1, status={"result": "ok1"})
-    mock_return2 = EngineTrigger(request_id=request_id, name="trigger2", trigger_id="tid2", attempt=3, status={"result": "ok2"})
-    mock_return3 = EngineTrigger(request_id=request_id, name="trigger3", trigger_id="tid3", attempt=4, status={"result": "ok3"})
+    # Mock the action_trigger method using AsyncMock, simulating the status it adds
+    monkeypatch.setattr(client, "action_trigger", AsyncMock(side_effect=ACTION_TRIGGERS_RESULTS))
 
-    # Mock the action_trigger method using AsyncMock
-    client.action_trigger = AsyncMock(side_effect=[mock_return1, mock_return2, mock_return3])
+    results = await client.action_triggers(REQUEST_ID, triggers_input)
 
-    results = await client.action_triggers(request_id, triggers_input)
-
-    # Verify action_trigger was called correctly for each input trigger
-    expected_calls = [
-        call(expected_trigger1),
-        call(expected_trigger2),
-        call(expected_trigger3),
+    # Verify action_trigger was called for each input trigger, in order (asyncio.gather preserves order)
+    sent = [c.args[0] for c in client.action_trigger.call_args_list]
+    got = [(t.request_id, t.name, t.trigger_id, t.attempt) for t in sent]
+    assert got == [
+        (REQUEST_ID, "trigger1", "tid1", 1),
+        (REQUEST_ID, "trigger2", "tid2", 3),
+        (REQUEST_ID, "trigger3", "tid3", 4),
     ]
-    client.action_trigger.assert_has_calls(expected_calls, any_order=False) # asyncio.gather preserves order
-    assert client.action_trigger.call_count == len(triggers_input)
 
     # Verify the results returned by action_triggers match the mocked return values
-    assert results == [mock_return1, mock_return2, mock_return3]
+    assert results == ACTION_TRIGGERS_RESULTS
 
 
-@pytest.mark.asyncio
-async def test_scheduled_call_response_success(client: EngineClient, test_endpoint: str, test_token: str, expected_user_agent: str):
+async def test_scheduled_call_response_success(client: EngineClient, api_mock: respx.MockRouter):
     """Test successful scheduled call response."""
-    mock_event = MagicMock(spec=TelliWebhook)
-    mock_event.model_dump_json.return_value = '{"event": "call_answered", "call_sid": "C123"}'
+    mock_event = _StubTelli('{"event": "call_answered", "call_sid": "C123"}')
 
     expected_payload = {"event": "call_answered", "call_sid": "C123"}
     response_payload = {"status": "ok"}
-    expected_url = f"{test_endpoint}/api/scheduled_call_response"
+    expected_url = f"{TEST_ENDPOINT}/api/scheduled_call_response"
 
-    with respx.mock() as mock:
-        mock.post(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
-        response = await client.scheduled_call_response(mock_event)
+    route = api_mock.post(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
+    response = await client.scheduled_call_response(mock_event)
 
-        assert response == response_payload
-        mock_event.model_dump_json.assert_called_once_with(exclude_none=True, exclude_unset=True)
-        assert len(mock.calls) > 0
-        req_sent = mock.calls.last.request
-        assert req_sent.headers["token"] == test_token
-        assert json.loads(req_sent.content) == expected_payload
+    assert response == response_payload
+    mock_event.model_dump_json.assert_called_once_with(exclude_none=True, exclude_unset=True)
+    assert route.call_count == 1
+    req_sent = route.calls.last.request
+    assert req_sent.headers["token"] == TEST_TOKEN
+    assert json.loads(req_sent.content) == expected_payload
 
 
-@pytest.mark.asyncio
-async def test_scheduled_call_response_failure(client: EngineClient, test_endpoint: str):
+async def test_scheduled_call_response_failure(client: EngineClient, api_mock: respx.MockRouter):
     """Test failed scheduled call response."""
-    mock_event = MagicMock(spec=TelliWebhook)
-    mock_event.model_dump_json.return_value = '{"event": "call_failed"}'
-    expected_url = f"{test_endpoint}/api/scheduled_call_response"
-
-    with respx.mock() as mock:
-        mock.post(expected_url).mock(return_value=httpx.Response(400))
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await client.scheduled_call_response(mock_event)
-        assert exc_info.value.response.status_code == 400
-
-
-@pytest.mark.asyncio
-async def test_get_request_documents_success(
-    client: EngineClient, test_endpoint: str, test_token: str, request_id: int, expected_user_agent: str
-):
-    """Test successful retrieval of request documents."""
-    expected_path = f"/api/admin/requests/{request_id}/documents.json"
-    expected_url = f"{test_endpoint}{expected_path}"
-    response_payload: dict = {
-        "request": {
-            "id": request_id,
-            "files": [
-                {
-                    "id": 2469711,
-                    "physical_mails": [],
-                    "type": "IN_Erfolgs_Vereinbarung bei Mietsenkung_en",
-                    "image": False,
-                    "pdf": True,
-                    "filename": "Erfolgs-Vereinbarung bei Mietsenkung_English.pdf",
-                    "incoming": False,
-                    "uncategorized": False,
-                    "edit_url": f"/admin/requests/{request_id}/zieb?document_id=2469711",
-                    "approved": True,
-                    "attachment": False,
-                    "created_at": "2025-11-26T15:01:36.778Z",
-                    "court_processing_kind": None,
-                    "type_title": "IN_Erfolgs_Vereinbarung bei Mietsenkung_en",
-                    "approved_at": "Mittwoch, 26. November 2025, 16:01 Uhr",
-                    "uploaded_by": "00 Mietright Zentrale",
-                    "approved_by": "00 Mietright Zentrale",
-                    "created_at_text": "etwa 20 Stunden",
-                    "approved_at_text": "Mittwoch, 26. November 2025, 16:01 Uhr",
-                    "sensitive": False,
-                    "eb_date": None,
-                    "court_id": None,
-                    "court_type": False,
-                    "file_extension": "pdf",
-                    "court_attachment": False,
-                    "original_size": 78920,
-                    "size": "77,1 KB",
-                }
-            ],
-        },
-        "presigned_post": {
-            "s3-data": {
-                "key": f"requests/{request_id}/files/some-uuid/${{filename}}",
-                "success_action_status": "201",
-                "acl": "private",
-                "policy": "some-policy",
-                "x-amz-credential": "some-credential",
-                "x-amz-algorithm": "AWS4-HMAC-SHA256",
-                "x-amz-date": "20251127T112143Z",
-                "x-amz-signature": "some-signature",
-            },
-            "s3-url": "https://some.s3.url.com",
-            "s3-host": "some.s3.host.com",
-        },
-    }
-
-    with respx.mock() as mock:
-        mock.get(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
-        response = await client.get_request_documents(request_id)
-        assert isinstance(response, RequestDocumentsResponse)
-        assert response.request.id == request_id
-        assert len(response.request.files) == 1
-        assert response.request.files[0].id == 2469711
-        assert response.presigned_post.s3_url == "https://some.s3.url.com"
-        assert len(mock.calls) > 0
-        req_sent = mock.calls.last.request
-        assert req_sent.headers["token"] == test_token
-
-
-@pytest.mark.asyncio
-async def test_get_request_documents_failure(client: EngineClient, test_endpoint: str, request_id: int):
-    """Test failed retrieval of request documents."""
-    expected_url = f"{test_endpoint}/api/admin/requests/{request_id}/documents.json"
-    with respx.mock() as mock:
-        mock.get(expected_url).mock(return_value=httpx.Response(404))
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await client.get_request_documents(request_id)
-        assert exc_info.value.response.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_get_document_json_success(
-    client: EngineClient, test_endpoint: str, test_token: str, doc_id: int, expected_user_agent: str
+    mock_event = _StubTelli('{"event": "call_failed"}')
+    expected_url = f"{TEST_ENDPOINT}/api/scheduled_call_response"
+
+    api_mock.post(expected_url).mock(return_value=httpx.Response(400))
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.scheduled_call_response(mock_event)
+    assert exc_info.value.response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    ("url", "call", "body", "headers", "fields", "expected"),
+    [
+        pytest.param(
+            REQUEST_DOCS_URL,
+            lambda c: c.get_request_documents(REQUEST_ID),
+            REQUEST_DOCS_BODY,
+            EXPECTED_HEADERS,
+            lambda r: (type(r), r.request.id, r.request.files[0].id, r.presigned_post.s3_url),
+            (RequestDocumentsResponse, REQUEST_ID, 2469711, "https://some.s3.url.com"),
+            id="get_request_documents",
+        ),
+        pytest.param(
+            DOCUMENT_URL,
+            lambda c: c.get_document_url(DOC_ID),
+            DOCUMENT_URL_BODY,
+            EXPECTED_JSON_HEADERS,
+            lambda r: (type(r), r.url),
+            (DocumentUrlResponse, "https://s3.example.com/some/file.pdf?sig=123"),
+            id="get_document_url",
+        ),
+    ],
+)
+async def test_get_json_endpoint(
+    client: EngineClient,
+    api_mock: respx.MockRouter,
+    *,
+    url: str,
+    call: Callable[[EngineClient], Awaitable[BaseModel]],
+    body: bytes,
+    headers: dict[str, str],
+    fields: Callable[[BaseModel], tuple],
+    expected: tuple,
 ):
-    """Test successfully retrieving a document URL as JSON."""
-    expected_path = f"/api/admin/documents/{doc_id}"
-    expected_url = f"{test_endpoint}{expected_path}"
-    presigned_url = "https://s3.example.com/some/file.pdf?sig=123"
-    response_payload = {"url": presigned_url}
-
-    with respx.mock() as mock:
-        mock.get(expected_url).mock(return_value=httpx.Response(200, json=response_payload))
-        response = await client.get_document_url(doc_id)
-        assert isinstance(response, DocumentUrlResponse)
-        assert response.url == presigned_url
-        assert len(mock.calls) > 0
-        req_sent = mock.calls.last.request
-        assert req_sent.headers["token"] == test_token
-        assert req_sent.headers["accept"] == "application/json"
-
-
-@pytest.mark.asyncio
-async def test_download_document_spooled_success(
-    client: EngineClient, test_endpoint: str, test_token: str, doc_id: int, expected_user_agent: str
+    """Test GET endpoints returning a JSON body parsed into a model; `fields` picks the values to check."""
+    route = api_mock.get(url).mock(
+        return_value=httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+    )
+    response = await call(client)
+    assert fields(response) == expected
+    assert route.call_count == 1
+    _assert_request(route.calls.last.request, headers)
+
+
+@pytest.mark.parametrize(
+    ("url", "call", "status", "headers", "timeout"),
+    [
+        pytest.param(
+            f"{TEST_ENDPOINT}/_health", lambda c: c.health(), 500, EXPECTED_HEADERS, HEALTH_TIMEOUT, id="health"
+        ),
+        pytest.param(
+            CASE_DATA_URL,
+            lambda c: c.get_case_data(REQUEST_ID),
+            404,
+            EXPECTED_HEADERS,
+            DEFAULT_TIMEOUT,
+            id="get_case_data",
+        ),
+        pytest.param(
+            REQUEST_DOCS_URL,
+            lambda c: c.get_request_documents(REQUEST_ID),
+            404,
+            EXPECTED_HEADERS,
+            DEFAULT_TIMEOUT,
+            id="get_request_documents",
+        ),
+        pytest.param(
+            DOCUMENT_URL,
+            lambda c: c.get_document_url(DOC_ID),
+            404,
+            EXPECTED_JSON_HEADERS,
+            DEFAULT_TIMEOUT,
+            id="get_document_url",
+        ),
+    ],
+)
+async def test_get_endpoint_error(
+    client: EngineClient,
+    api_mock: respx.MockRouter,
+    *,
+    url: str,
+    call: Callable[[EngineClient], Awaitable[object]],
+    status: int,
+    headers: dict[str, str],
+    timeout: httpx.Timeout,
 ):
-    """Test successfully downloading a document file to a SpooledTemporaryFile."""
-    api_path = f"/api/admin/documents/{doc_id}"
-    api_url = f"{test_endpoint}{api_path}"
-    file_content = b"This is a test PDF content."
+    """Test GET endpoints raising on an error status."""
+    route = api_mock.get(url).mock(return_value=httpx.Response(status))
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await call(client)
+    assert exc_info.value.response.status_code == status
+    assert route.call_count == 1
+    _assert_request(route.calls.last.request, headers, timeout=timeout)
 
-    with respx.mock() as mock:
-        # httpx follows redirects at client level; mock the final URL directly
-        mock.get(api_url).mock(return_value=httpx.Response(200, content=file_content))
 
-        response_file = await client.download_document(doc_id)
+async def test_download_document_spooled_success(client: EngineClient, api_mock: respx.MockRouter):
+    """Test successfully downloading a document file to a SpooledTemporaryFile."""
+    # httpx follows redirects at client level; mock the final URL directly
+    route = api_mock.get(DOCUMENT_URL).mock(return_value=httpx.Response(200, content=PDF_CONTENT))
 
-        assert response_file.read() == file_content
-        response_file.close()
-        assert len(mock.calls) > 0
-        req_sent = mock.calls.last.request
-        assert req_sent.headers["token"] == test_token
+    response_file = await client.download_document(DOC_ID)
 
+    assert response_file.read() == PDF_CONTENT
+    response_file.close()
+    assert route.call_count == 1
+    _assert_request(route.calls.last.request, EXPECTED_HEADERS, timeout=TRANSFER_TIMEOUT)
 
-@pytest.mark.asyncio
-async def test_download_document_to_directory_success(
-    client: EngineClient, test_endpoint: str, doc_id: int, tmp_path: os.PathLike
-):
+
+async def test_download_document_to_directory_success(client: EngineClient, tmp_path: Path, api_mock: respx.MockRouter):
     """Test successfully downloading a document to a directory, inferring filename."""
-    api_path = f"/api/admin/documents/{doc_id}"
-    api_url = f"{test_endpoint}{api_path}"
-    file_content = b"This is content for a directory download."
     filename = "inferred_document.pdf"
 
-    with respx.mock() as mock:
-        mock.get(api_url).mock(
-            return_value=httpx.Response(
-                200,
-                content=file_content,
-                headers={"Content-Disposition": f"attachment; filename={filename}"},
-            )
+    api_mock.get(DOCUMENT_URL).mock(
+        return_value=httpx.Response(
+            200,
+            content=PDF_CONTENT,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
+    )
 
-        returned_path = await client.download_document(doc_id, filepath=str(tmp_path))
+    returned_path = await client.download_document(DOC_ID, filepath=str(tmp_path))
 
-        expected_output_path = os.path.join(tmp_path, filename)
-        assert returned_path == expected_output_path
-        assert os.path.exists(expected_output_path)
-        with open(expected_output_path, "rb") as f:
-            assert f.read() == file_content
+    expected_output_path = tmp_path / filename
+    assert returned_path == str(expected_output_path)
+    assert expected_output_path.read_bytes() == PDF_CONTENT
 
 
-@pytest.mark.asyncio
-async def test_download_document_to_file_success(
-    client: EngineClient, test_endpoint: str, doc_id: int, tmp_path: os.PathLike
-):
+async def test_download_document_to_file_success(client: EngineClient, tmp_path: Path, api_mock: respx.MockRouter):
     """Test successfully downloading a document to a specified file path."""
-    api_path = f"/api/admin/documents/{doc_id}"
-    api_url = f"{test_endpoint}{api_path}"
-    file_content = b"This is file content saved to disk."
-    output_path = os.path.join(tmp_path, "downloaded.pdf")
+    output_path = tmp_path / "downloaded.pdf"
 
-    with respx.mock() as mock:
-        mock.get(api_url).mock(return_value=httpx.Response(200, content=file_content))
+    api_mock.get(DOCUMENT_URL).mock(return_value=httpx.Response(200, content=PDF_CONTENT))
 
-        result = await client.download_document(doc_id, filepath=output_path)
+    result = await client.download_document(DOC_ID, filepath=str(output_path))
 
-        assert result is None
-        assert os.path.exists(output_path)
-        with open(output_path, "rb") as f:
-            assert f.read() == file_content
+    assert result is None
+    assert output_path.read_bytes() == PDF_CONTENT
 
 
 # TODO: Add tests verifying specific header content (e.g., token, content-type) more explicitly if needed.
@@ -1,24 +1,26 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi import FastAPI
+from pytest_mock import MockerFixture
 
 from enginepy.config import ConfigSchema, LogfireConfigSchema
-from enginepy.init import init, init_logfire
+from enginepy.init import _EXCLUDED_URLS, init, init_logfire
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_logfire_config() -> LogfireConfigSchema:
     """Fixture for a LogfireConfigSchema with a token."""
     return LogfireConfigSchema(token="test-logfire-token")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_logfire_config_no_token() -> LogfireConfigSchema:
     """Fixture for a LogfireConfigSchema without a token."""
     return LogfireConfigSchema(token="")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config(mock_logfire_config: LogfireConfigSchema) -> ConfigSchema:
     """Fixture for a main ConfigSchema."""
     cfg = ConfigSchema(app={"env": "test-env"})  # Uses defaults
@@ -26,7 +28,7 @@ def mock_config(mock_logfire_config: LogfireConfigSchema) -> ConfigSchema:
     return cfg
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config_no_token(mock_logfire_config_no_token: LogfireConfigSchema) -> ConfigSchema:
     """Fixture for a main ConfigSchema with no logfire token."""
     cfg = ConfigSchema(app={"env": "test-env-no-token"})  # Uses defaults
@@ -34,50 +36,62 @@ def mock_config_no_token(mock_logfire_config_no_token: LogfireConfigSchema) -> C
     return cfg
 
 
-@patch("enginepy.init.logfire")
-def test_init_logfire_with_token(mock_logfire, mock_logfire_config: LogfireConfigSchema):
-    """Test init_logfire when a token is provided."""
-    extra = {"env": "dev"}
-    init_logfire(mock_logfire_config, mode="worker", extra=extra)
+@pytest.fixture(scope="module")
+def fastapi_app_mock() -> MagicMock:
+    """Fixture for a FastAPI app mock, specced on FastAPI."""
+    return MagicMock(spec=FastAPI)
 
-    mock_logfire.configure.assert_called_once_with(token="test-logfire-token", environment="dev")
-    mock_logfire.instrument_openai_agents.assert_called_once()
-    mock_logfire.instrument_fastapi.assert_not_called()
 
+class TestInitLogfire:
+    """Tests for init_logfire, sharing a patched logfire module."""
 
-@patch("enginepy.init.logfire")
-def test_init_logfire_without_token(mock_logfire, mock_logfire_config_no_token: LogfireConfigSchema):
-    """Test init_logfire when no token is provided."""
-    init_logfire(mock_logfire_config_no_token, mode="worker", extra={})
+    @pytest.fixture(autouse=True)
+    def mock_logfire(self, mocker: MockerFixture) -> MagicMock:
+        """Patches the logfire module used by enginepy.init."""
+        return mocker.patch("enginepy.init.logfire")
 
-    mock_logfire.configure.assert_not_called()
-    mock_logfire.instrument_openai_agents.assert_not_called()
-    mock_logfire.instrument_fastapi.assert_not_called()
+    def test_init_logfire_with_token(self, mock_logfire: MagicMock, mock_logfire_config: LogfireConfigSchema):
+        """Test init_logfire when a token is provided."""
+        extra = {"env": "dev"}
+        init_logfire(mock_logfire_config, mode="worker", extra=extra)
 
+        mock_logfire.configure.assert_called_once_with(token="test-logfire-token", environment="dev")
+        mock_logfire.instrument_openai_agents.assert_called_once()
+        mock_logfire.instrument_fastapi.assert_not_called()
 
-@patch("enginepy.init.logfire")
-def test_init_logfire_server_mode_with_app(mock_logfire, mock_logfire_config: LogfireConfigSchema):
-    """Test init_logfire in server mode with an app provided."""
-    mock_app = MagicMock()
-    extra = {"env": "prod", "app": mock_app}
-    init_logfire(mock_logfire_config, mode="server", extra=extra)
+    def test_init_logfire_without_token(
+        self, mock_logfire: MagicMock, mock_logfire_config_no_token: LogfireConfigSchema
+    ):
+        """Test init_logfire when no token is provided."""
+        init_logfire(mock_logfire_config_no_token, mode="worker", extra={})
 
-    mock_logfire.configure.assert_called_once_with(token="test-logfire-token", environment="prod")
-    mock_logfire.instrument_openai_agents.assert_called_once()
-    mock_logfire.instrument_fastapi.assert_called_once_with(
-        mock_app, capture_headers=True, excluded_urls=[".*/docs", ".*/redoc", ".*/metrics", ".*/health"]
-    )
+        mock_logfire.configure.assert_not_called()
+        mock_logfire.instrument_openai_agents.assert_not_called()
+        mock_logfire.instrument_fastapi.assert_not_called()
 
+    def test_init_logfire_server_mode_with_app(
+        self, mock_logfire: MagicMock, mock_logfire_config: LogfireConfigSchema, fastapi_app_mock: MagicMock
+    ):
+        """Test init_logfire in server mode with an app provided."""
+        extra = {"env": "prod", "app": fastapi_app_mock}
+        init_logfire(mock_logfire_config, mode="server", extra=extra)
 
-@patch("enginepy.init.logfire")
-def test_init_logfire_server_mode_without_app(mock_logfire, mock_logfire_config: LogfireConfigSchema):
-    """Test init_logfire in server mode without an app provided."""
-    extra = {"env": "staging"} # No 'app' key
-    init_logfire(mock_logfire_config, mode="server", extra=extra)
+        mock_logfire.configure.assert_called_once_with(token="test-logfire-token", environment="prod")
+        mock_logfire.instrument_openai_agents.assert_called_once()
+        mock_logfire.instrument_fastapi.assert_called_once_with(
+            fastapi_app_mock, capture_headers=True, excluded_urls=_EXCLUDED_URLS
+        )
 
-    mock_logfire.configure.assert_called_once_with(token="test-logfire-token", environment="staging")
-    mock_logfire.instrument_openai_agents.assert_called_once()
-    mock_logfire.instrument_fastapi.assert_not_called()
+    def test_init_logfire_server_mode_without_app(
+        self, mock_logfire: MagicMock, mock_logfire_config: LogfireConfigSchema
+    ):
+        """Test init_logfire in server mode without an app provided."""
+        extra = {"env": "staging"}  # No 'app' key
+        init_logfire(mock_logfire_config, mode="server", extra=extra)
+
+        mock_logfire.configure.assert_called_once_with(token="test-logfire-token", environment="staging")
+        mock_logfire.instrument_openai_agents.assert_called_once()
+        mock_logfire.instrument_fastapi.assert_not_called()
 
 
 @patch("enginepy.init.init_logfire")
@@ -86,12 +100,11 @@ def test_init_calls_init_logfire(mock_init_logfire, mock_config: ConfigSchema):
     extra_in = {"some_key": "some_value"}
     init(mock_config, mode="server", extra=extra_in)
 
-    # Check that the original extra dict was modified
-    assert "env" in extra_in
-    assert extra_in["env"] == "test-env"
-
-    # Check that init_logfire was called with the modified extra dict
-    mock_init_logfire.assert_called_once_with(mock_config.logfire, "server", extra_in)
+    # Check that init_logfire was called with the extra dict merged with the env
+    expected_extra = {"some_key": "some_value", "env": "test-env"}
+    mock_init_logfire.assert_called_once_with(mock_config.logfire, "server", expected_extra)
+    # The caller's dict is left untouched
+    assert extra_in == {"some_key": "some_value"}
 
 
 @patch("enginepy.init.init_logfire")